@@ -0,0 +1,102 @@
+"""Benchmarks for the parts of the game that have to scale.
+
+Run with `python benchmark.py`. The world needs an OpenGL context to load its
+texture, so a hidden window is created first.
+"""
+import random
+import time
+import pyglet
+from world import World
+from entities import Entities
+from blocks import SandBlock
+from terrain import noise_field, naive_noise_field
+from noise import Noise
+
+
+def benchmark_entities(world, num_entities=500, num_ticks=60, num_steps=10):
+    """Reports how many entities are updated per millisecond.
+
+    Every tick does the same number of small steps as Game.update does.
+    """
+    entities = Entities(gravity=0.5, terminal_velocity=10.0)
+    for i in xrange(num_entities):
+        position = (random.uniform(-24, 24), random.uniform(10, 40),
+                    random.uniform(-24, 24))
+        velocity = (random.uniform(-1, 1), 0, random.uniform(-1, 1))
+        entities.add(position, (0.8, 2, 0.8), velocity)
+    dt = 4.0 / 60 / num_steps
+    start = time.clock()
+    for tick in xrange(num_ticks):
+        for step in xrange(num_steps):
+            entities.update(dt, world)
+    elapsed = (time.clock() - start) * 1000.0
+    print('entities: %d entities, %.2f ms per tick, %.1f entities/ms' %
+          (num_entities, elapsed / num_ticks,
+           num_entities * num_ticks / elapsed))
+
+
+def benchmark_compression(world):
+    """Reports how well inactive chunks compress and how long it takes to
+    decompress them again.
+    """
+    stats = world.compression_stats
+    if not stats['chunks']:
+        print('compression: no compressed chunks')
+        return
+    ratio = stats['raw_nbytes'] / float(stats['nbytes'])
+    print('compression: %d chunks, %d KB -> %d KB, ratio %.1f' %
+          (stats['chunks'], stats['raw_nbytes'] / 1024,
+           stats['nbytes'] / 1024, ratio))
+    for chunk in list(world.compressed):
+        world.expand_chunk(chunk)
+    print('decompression: %.3f ms per chunk' %
+          (stats['decompress_time'] * 1000.0 / stats['decompressions']))
+
+
+def benchmark_terrain(num_chunks=20, shape=(16, 16, 16)):
+    """Reports how many voxels of 3D noise are generated per second, by
+    interpolating a coarse lattice and by evaluating every voxel.
+    """
+    num_voxels = num_chunks * shape[0] * shape[1] * shape[2]
+    noise = Noise(0)
+    results = []
+    for field in (noise_field, naive_noise_field):
+        start = time.clock()
+        for i in xrange(num_chunks):
+            field(noise, i * shape[0], 0, 0, shape)
+        results.append(num_voxels / (time.clock() - start))
+    error = abs(noise_field(noise, 0, 0, 0, shape) -
+                naive_noise_field(noise, 0, 0, 0, shape)).max()
+    print('terrain: lattice %.0f voxels/s, naive %.0f voxels/s, '
+          'speedup %.1fx, max error %.3f' %
+          (results[0], results[1], results[0] / results[1], error))
+
+
+def benchmark_block_ticks(world, num_blocks=2000, max_time=0.004):
+    """Drops sand blocks from the sky and reports how many block updates run
+    per millisecond while staying within the simulation budget of a frame.
+    """
+    for i in xrange(num_blocks):
+        x, z = random.randint(-32, 31), random.randint(-32, 31)
+        world.add_block((x, 30 + i % 20, z), SandBlock())
+    num_frames = 0
+    num_updates = 0
+    start = time.clock()
+    while len(world.ticks):
+        num_updates += world.simulate(1.0/60, max_time)
+        num_frames += 1
+    elapsed = (time.clock() - start) * 1000.0
+    print('block ticks: %d updates in %d frames, %.2f ms per frame, '
+          '%.1f updates/ms' % (num_updates, num_frames,
+                               elapsed / num_frames, num_updates / elapsed))
+
+
+if __name__ == '__main__':
+    window = pyglet.window.Window(visible=False)
+    world = World()
+    world.load_chunks((0, 0, 0))
+    world.update(float('inf'))
+    benchmark_entities(world)
+    benchmark_compression(world)
+    benchmark_block_ticks(world)
+    benchmark_terrain()
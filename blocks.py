@@ -1,3 +1,6 @@
+import random
+
+
 class Block(object):
     """Represents a block in the world
 
@@ -10,12 +13,19 @@ class Block(object):
             side of the cube.
         texture_data: The texture data that is send to the vertex buffer, this
             attribute is generated based on the above three attributes.
+        tick_delay: The number of ticks after which scheduled_tick is called
+            when the block or one of its neighbors changes. If it is 0 the
+            block is never scheduled.
+        random_ticks: Whether random_tick is called on the block.
+        id: The index of the block type in BLOCK_TYPES.
     """
     name = "UNKNOWN"
     top_texture = (0, 0)
     bottom_texture = (0, 0)
     side_texture = (0, 0)
     texture_data = []
+    tick_delay = 0
+    random_ticks = False
 
     def __init__(self):
         if not self.texture_data:
@@ -45,6 +55,24 @@ class Block(object):
         top_left = [x, y+size]
         return bottom_left + bottom_right + top_right + top_left
 
+    def scheduled_tick(self, world, position):
+        """Called tick_delay ticks after the block or a neighbor changed.
+
+        Args:
+            world: The world containing the block.
+            position: The position of the block.
+        """
+        pass
+
+    def random_tick(self, world, position):
+        """Called at random moments when the block is in an active chunk.
+
+        Args:
+            world: The world containing the block.
+            position: The position of the block.
+        """
+        pass
+
     @staticmethod
     def cube_vertices(x, y, z, size=0.5):
         """Returns coordinates for a cube
@@ -83,6 +111,32 @@ class GrassBlock(Block):
     bottom_texture = (0, 1)
     side_texture = (0, 0)
     texture_data = []
+    random_ticks = True
+
+    def random_tick(self, world, position):
+        """Turns into dirt when covered, otherwise spreads to nearby dirt.
+        """
+        x, y, z = position
+        if (x, y+1, z) in world.blocks:
+            world.add_block(position, DirtBlock())
+            return
+        target = (x + random.randint(-1, 1), y + random.randint(-1, 1),
+                  z + random.randint(-1, 1))
+        # The target can be in a diagonal chunk, which the scheduler does not
+        # expand.
+        world.expand_chunk(world.chunk_position(target))
+        x, y, z = target
+        if (isinstance(world.blocks.get(target), DirtBlock) and
+                (x, y+1, z) not in world.blocks):
+            world.add_block(target, GrassBlock())
+
+
+class DirtBlock(Block):
+    name = 'Dirt'
+    top_texture = (0, 1)
+    bottom_texture = (0, 1)
+    side_texture = (0, 1)
+    texture_data = []
 
 
 class SandBlock(Block):
@@ -91,6 +145,17 @@ class SandBlock(Block):
     bottom_texture = (1, 1)
     side_texture = (1, 1)
     texture_data = []
+    tick_delay = 2
+
+    def scheduled_tick(self, world, position):
+        """Falls down one block if there is nothing below it.
+        """
+        x, y, z = position
+        below = (x, y-1, z)
+        if below in world.blocks or below[1] < world.lowest_y:
+            return
+        world.remove_block(position)
+        world.add_block(below, self)
 
 
 class StoneBlock(Block):
@@ -107,3 +172,10 @@ class BrickBlock(Block):
     bottom_texture = (2, 0)
     side_texture = (2, 0)
     texture_data = []
+
+
+# The id of a block type is its index in this list, meshes use it to look up
+# the textures of a block.
+BLOCK_TYPES = [GrassBlock, DirtBlock, SandBlock, StoneBlock, BrickBlock]
+for block_id, block_type in enumerate(BLOCK_TYPES):
+    block_type.id = block_id
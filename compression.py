@@ -0,0 +1,104 @@
+import sys
+import numpy as np
+
+
+class CompressedChunk(object):
+    """A chunk of blocks stored in compressed form.
+
+    Blocks are stored as a palette of block types and runs of identical
+    blocks along the y-axis of each column. Blocks do not have any state of
+    their own, so all blocks of the same type share one instance from the
+    palette after decompressing.
+
+    Attributes:
+        palette: A list with one block instance per block type in the chunk.
+        runs: An (R, 5) int32 array, each row is (x, y, z, length, index). It
+            describes `length` blocks of type palette[index] starting at
+            (x, y, z) and going up.
+        num_blocks: The number of blocks in the chunk.
+        raw_nbytes: An estimate of the memory the uncompressed blocks take.
+    """
+    def __init__(self, positions, blocks):
+        """Compresses blocks.
+
+        Args:
+            positions: A list of block positions.
+            blocks: A list with the block at each position.
+        """
+        self.num_blocks = len(positions)
+        self.raw_nbytes = self.expanded_nbytes(positions, blocks)
+        self.palette = []
+        if not positions:
+            self.runs = np.zeros((0, 5), dtype=np.int32)
+            return
+        palette_index = {}
+        indices = np.empty(len(blocks), dtype=np.int32)
+        for i, block in enumerate(blocks):
+            block_type = type(block)
+            if block_type not in palette_index:
+                palette_index[block_type] = len(self.palette)
+                self.palette.append(block)
+            indices[i] = palette_index[block_type]
+        positions = np.array(positions, dtype=np.int32)
+        order = np.lexsort((positions[:, 1], positions[:, 2], positions[:, 0]))
+        positions = positions[order]
+        indices = indices[order]
+        # A new run starts when we move to another column, skip air or
+        # encounter another type of block.
+        starts = np.ones(len(positions), dtype=bool)
+        starts[1:] = ((positions[1:, 0] != positions[:-1, 0]) |
+                      (positions[1:, 2] != positions[:-1, 2]) |
+                      (positions[1:, 1] != positions[:-1, 1] + 1) |
+                      (indices[1:] != indices[:-1]))
+        start_indices = np.nonzero(starts)[0]
+        lengths = np.diff(np.append(start_indices, len(positions)))
+        self.runs = np.empty((len(start_indices), 5), dtype=np.int32)
+        self.runs[:, :3] = positions[start_indices]
+        self.runs[:, 3] = lengths
+        self.runs[:, 4] = indices[start_indices]
+
+    @staticmethod
+    def expanded_nbytes(positions, blocks):
+        """Estimates the memory used by blocks stored in the world.
+
+        Every block costs its position tuple, its block instance, an entry in
+        World.blocks (hash, key and value) and an entry in World.chunks.
+        """
+        if not positions:
+            return 0
+        per_block = (sys.getsizeof(positions[0]) + sys.getsizeof(blocks[0]) +
+                     4*8)
+        return len(positions) * per_block
+
+    @property
+    def nbytes(self):
+        """The memory used by the compressed blocks.
+        """
+        return self.runs.nbytes + sum(sys.getsizeof(block)
+                                      for block in self.palette)
+
+    @property
+    def ratio(self):
+        """How many times smaller the compressed chunk is.
+        """
+        return self.raw_nbytes / float(max(self.nbytes, 1))
+
+    def decompress(self):
+        """Decompresses the blocks.
+
+        Returns:
+            A tuple (positions, blocks) of lists, just like the arguments used
+            to create the compressed chunk.
+        """
+        runs = self.runs
+        lengths = runs[:, 3]
+        positions = np.repeat(runs[:, :3], lengths, axis=0)
+        run_starts = np.cumsum(lengths) - lengths
+        positions[:, 1] += (np.arange(self.num_blocks) -
+                            np.repeat(run_starts, lengths))
+        palette = np.empty(len(self.palette), dtype=object)
+        palette[:] = self.palette
+        blocks = palette[np.repeat(runs[:, 4], lengths)].tolist()
+        # Building the tuples from columns is a lot faster than converting
+        # each row.
+        return zip(*positions.T.tolist()), blocks
@@ -0,0 +1,201 @@
+import numpy as np
+
+
+def discretize_many(positions):
+    """Vectorized version of utils.discretize.
+
+    Rounds half away from zero, just like the builtin round does.
+
+    Args:
+        positions: An (N, 3) array of positions.
+
+    Returns:
+        An (N, 3) integer array with the block position of each position.
+    """
+    rounded = np.where(positions >= 0, np.floor(positions + 0.5),
+                       np.ceil(positions - 0.5))
+    return rounded.astype(np.int64)
+
+
+class Entities(object):
+    """Holds all entities (mobs, dropped items...) in the world.
+
+    The state is stored as a structure of arrays, so gravity, movement and
+    collision can be computed for all entities at once instead of looping over
+    Python objects. Entities are referred to by their index, removing an entity
+    moves the last entity into its place.
+
+    Attributes:
+        gravity: The acceleration downwards per time unit.
+        terminal_velocity: The maximum speed at which an entity can fall.
+        count: The number of entities.
+        positions: An (N, 3) array with the position of each entity.
+        velocities: An (N, 3) array with the velocity of each entity.
+        sizes: An (N, 3) array with the width, height and depth of the
+            bounding box of each entity. Like the player, the position of an
+            entity is the center of the topmost block it occupies.
+    """
+    def __init__(self, gravity, terminal_velocity, capacity=64):
+        self.gravity = gravity
+        self.terminal_velocity = terminal_velocity
+        self.count = 0
+        self._positions = np.zeros((capacity, 3))
+        self._velocities = np.zeros((capacity, 3))
+        self._sizes = np.zeros((capacity, 3))
+
+    @property
+    def positions(self):
+        return self._positions[:self.count]
+
+    @property
+    def velocities(self):
+        return self._velocities[:self.count]
+
+    @property
+    def sizes(self):
+        return self._sizes[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def add(self, position, size=(1, 1, 1), velocity=(0, 0, 0)):
+        """Adds an entity.
+
+        Args:
+            position: The position of the entity.
+            size: The width, height and depth of the entity.
+            velocity: The initial velocity of the entity.
+
+        Returns:
+            The index of the new entity.
+        """
+        if self.count == len(self._positions):
+            self._grow()
+        index = self.count
+        self._positions[index] = position
+        self._velocities[index] = velocity
+        self._sizes[index] = size
+        self.count += 1
+        return index
+
+    def remove(self, index):
+        """Removes an entity by moving the last entity into its place.
+
+        Args:
+            index: The index of the entity to remove.
+        """
+        last = self.count - 1
+        for array in (self._positions, self._velocities, self._sizes):
+            array[index] = array[last]
+        self.count = last
+
+    def _grow(self):
+        """Doubles the capacity of the arrays.
+        """
+        capacity = 2*len(self._positions)
+        for name in ('_positions', '_velocities', '_sizes'):
+            array = np.zeros((capacity, 3))
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+
+    def integrate(self, dt):
+        """Moves all entities horizontally according to their velocity.
+        """
+        self.positions[:, 0::2] += dt * self.velocities[:, 0::2]
+
+    def apply_gravity(self, dt, world):
+        """Applies gravity to all entities.
+
+        This does the same as Game.apply_gravity does for a single object.
+
+        Args:
+            dt: How much time has elapsed since the last step.
+            world: The world the entities live in.
+        """
+        velocities = self.velocities
+        positions = self.positions
+        velocities[:, 1] -= dt * self.gravity
+        np.maximum(velocities[:, 1], -self.terminal_velocity,
+                   out=velocities[:, 1])
+        dy = dt * velocities[:, 1]
+        heights = np.ceil(self.sizes[:, 1])
+        floors = world.lowest_y - 1 + heights
+        surfaces = world.surface_height_many(
+            discretize_many(positions)[:, 0::2])
+        above = ((surfaces != world.NO_SURFACE) &
+                 (positions[:, 1] >= surfaces + heights))
+        floors[above] = surfaces[above] + heights[above]
+        landed = positions[:, 1] + dy < floors
+        dy[landed] = floors[landed] - positions[landed, 1]
+        velocities[landed, 1] = 0
+        positions[:, 1] += dy
+
+    def collide(self, world, max_overlap=0.1):
+        """Pushes all entities out of the blocks they collide with.
+
+        This does the same as World.collides does for a single object, but
+        all blocks that have to be checked are looked up in a single call.
+        Entities that collide on the y-axis stop falling.
+
+        Like the player, an entity of width and depth 1 is treated as a
+        single column of blocks. Wider entities check every column their
+        bounding box covers, the box being the column stretched by half the
+        extra width on both sides.
+
+        Args:
+            world: The world containing the blocks.
+            max_overlap: How far an entity may overlap with a block.
+        """
+        if not self.count:
+            return
+        positions = self.positions
+        # How far the faces of each entity are from its center column, the
+        # y extent is handled by checking one block for each block of height.
+        extents = np.maximum((self.sizes - 1) / 2.0, 0)
+        extents[:, 1] = 0
+        heights = np.ceil(self.sizes[:, 1]).astype(np.int64)
+        old_y = positions[:, 1].copy()
+        for axis in xrange(3):
+            for direction in (-1, 1):
+                faces = positions[:, axis] + direction*extents[:, axis]
+                face_cells = discretize_many(faces[:, np.newaxis])[:, 0]
+                overlap = (faces - face_cells) * direction
+                candidates = np.nonzero(overlap >= max_overlap)[0]
+                if not len(candidates):
+                    continue
+                # Every candidate checks a box of blocks next to it on this
+                # axis, given by its lowest block and its size in blocks.
+                lowest = discretize_many(positions[candidates] -
+                                         extents[candidates])
+                highest = discretize_many(positions[candidates] +
+                                          extents[candidates])
+                counts = highest - lowest + 1
+                lowest[:, 1] -= heights[candidates] - 1
+                counts[:, 1] = heights[candidates]
+                if axis == 1:
+                    lowest[:, 1] += direction
+                else:
+                    lowest[:, axis] = face_cells[candidates] + direction
+                    counts[:, axis] = 1
+                offsets = np.indices(counts.max(axis=0)).reshape(3, -1).T
+                probes = lowest + offsets[:, np.newaxis, :]
+                valid = np.all(offsets[:, np.newaxis, :] < counts, axis=2)
+                solid = np.zeros(valid.shape, dtype=bool)
+                solid[valid] = world.solid_mask(probes[valid])
+                hit = candidates[solid.any(axis=0)]
+                positions[hit, axis] -= ((overlap[hit] - max_overlap) *
+                                         direction)
+        self.velocities[positions[:, 1] != old_y, 1] = 0
+
+    def update(self, dt, world):
+        """Moves all entities one step, applying gravity and collisions.
+
+        Args:
+            dt: How much time has elapsed since the last step.
+            world: The world the entities live in.
+        """
+        if not self.count:
+            return
+        self.integrate(dt)
+        self.apply_gravity(dt, world)
+        self.collide(world)
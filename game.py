@@ -3,6 +3,7 @@ import math
 import time
 from world import World
 from player import Player
+from entities import Entities
 from utils import discretize
 from pyglet.gl import *
 from pyglet.window import key, mouse
@@ -25,11 +26,16 @@ class Game(pyglet.window.Window):
         self.FOG_END = 60.0
         self.FOV = 65.0
         self.GRAVITY = 0.5
+        self.SIMULATION_TIME = 0.004
         self.exclusive = False
         self.world = World()
         self.player = Player((0, 50, 0))
+        self.entities = Entities(self.GRAVITY, self.TERMINAL_VELOCITY)
         self.world.load_chunks(self.player.position)
         self.world.update(float('inf'))
+        surface = self.world.surface_height(0, 0)
+        if surface is not None:
+            self.player.position = (0, surface + self.player.height, 0)
         self.player.velocity[1] = -1
         self.setup_opengl()
         self.setup_crosshair()
@@ -117,6 +123,10 @@ class Game(pyglet.window.Window):
     def apply_gravity(self, obj, dt):
         """Applies gravity to the given object
 
+        An object above the surface cannot fall below it, even if the blocks
+        it would land on are not loaded yet. Any other object cannot fall
+        below the lowest block of the world.
+
         Args:
             obj: The object to which we apply gravity
             dt: How much time has elapsed since the last step.
@@ -127,18 +137,23 @@ class Game(pyglet.window.Window):
         dy = dt*y_vel
         obj.velocity = [x_vel, y_vel, z_vel]
         x, y, z = obj.position
-        # Just temporary so you cannot fall into oblivion.
-        if y+dy <= 1:
-            dy = 1
+        # Standing on a block means being height above it, like at spawn.
+        floor = self.world.lowest_y - 1 + obj.height
+        surface = self.world.surface_height(x, z)
+        if surface is not None and y >= surface + obj.height:
+            floor = surface + obj.height
+        if y+dy < floor:
+            dy = floor - y
             obj.velocity[1] = 0
         obj.position = (x, y+dy, z)
 
     def update(self, dt):
         """Updates the game state.
 
-        It loads the new chunk the player is in. This takes quite some time, so
-        to remove lag we calculate how much time we have left to update the
-        world. We then apply gravity and check for collision in small steps.
+        It loads the new chunk the player is in and runs the block updates
+        within a fixed time budget. This takes quite some time, so to remove
+        lag we calculate how much time we have left to update the world. We
+        then apply gravity and check for collision in small steps.
         (This avoids falling through blocks when we make a big step.)
 
         Args:
@@ -146,6 +161,7 @@ class Game(pyglet.window.Window):
         """
         start = time.clock()
         self.world.load_chunks(self.player.position)
+        self.world.simulate(dt, self.SIMULATION_TIME)
         time_taken = time.clock()-start
         approx_time_left = max(0, 1.0/self.FRAMES_PER_SEC - time_taken)
         self.world.update(approx_time_left)
@@ -162,6 +178,7 @@ class Game(pyglet.window.Window):
             if new_pos[1] != self.player.position[1]:
                 self.player.velocity[1] = 0
             self.player.position = new_pos
+            self.entities.update(dt, self.world)
 
     def hit_test(self, position, direction, max_distance=8):
         """Tests whether a block is hit.
@@ -0,0 +1,150 @@
+import threading
+import traceback
+from array import array
+from collections import namedtuple
+from Queue import Queue
+import numpy as np
+from blocks import Block, BLOCK_TYPES
+
+
+# The corners of each face of a cube centered at the origin, in the order
+# used by Block.cube_vertices: top, bottom, left, right, front, back.
+FACE_CORNERS = np.array(Block.cube_vertices(0, 0, 0),
+                        dtype=np.float32).reshape(6, 4, 3)
+# The direction each face is facing, a face is only visible when there is no
+# block in that direction.
+FACE_NORMALS = [(0, 1, 0), (0, -1, 0), (-1, 0, 0), (1, 0, 0), (0, 0, 1),
+                (0, 0, -1)]
+
+# The texture coordinates of each face of each block type, indexed by id.
+TEXTURES = np.array([block_type().texture_data for block_type in BLOCK_TYPES],
+                    dtype=np.float32).reshape(-1, 6, 8)
+
+Mesh = namedtuple('Mesh', ['chunk', 'version', 'count', 'vertices',
+                           'tex_coords'])
+
+
+class ChunkSnapshot(object):
+    """An immutable copy of everything needed to build the mesh of a chunk.
+
+    Attributes:
+        chunk: The position of the chunk.
+        version: The version of the chunk when the snapshot was taken.
+        chunk_size: The size of a chunk.
+        positions: An (N, 3) array with the positions of the blocks.
+        types: An array of length N with the id of each block.
+        border: An (M, 3) array with the positions of the blocks in adjacent
+            chunks that touch a block of the chunk.
+    """
+    def __init__(self, chunk, version, chunk_size, positions, types, border):
+        self.chunk = chunk
+        self.version = version
+        self.chunk_size = chunk_size
+        self.positions = positions
+        self.types = types
+        self.border = border
+
+
+def build_mesh(snapshot):
+    """Builds the vertex data of all visible faces in a chunk.
+
+    Args:
+        snapshot: The ChunkSnapshot of the chunk.
+
+    Returns:
+        A Mesh with the vertices and texture coordinates of each visible face
+        packed in float32 arrays.
+    """
+    positions = snapshot.positions
+    if not len(positions):
+        return Mesh(snapshot.chunk, snapshot.version, 0, array('f'),
+                    array('f'))
+    size = snapshot.chunk_size
+    x, y, z = snapshot.chunk
+    # The occupied blocks of the chunk with a border of one block around it.
+    lowest = positions[:, 1].min() - 1
+    height = positions[:, 1].max() - lowest + 2
+    origin = np.array([x*size - 1, lowest, z*size - 1])
+    shape = (size + 2, height, size + 2)
+    occupied = np.zeros(shape, dtype=bool)
+    local = positions - origin
+    occupied[local[:, 0], local[:, 1], local[:, 2]] = True
+    if len(snapshot.border):
+        border = snapshot.border - origin
+        inside = np.all((border >= 0) & (border < shape), axis=1)
+        border = border[inside]
+        occupied[border[:, 0], border[:, 1], border[:, 2]] = True
+    vertices = []
+    tex_coords = []
+    for face, (dx, dy, dz) in enumerate(FACE_NORMALS):
+        exposed = ~occupied[local[:, 0] + dx, local[:, 1] + dy,
+                            local[:, 2] + dz]
+        if not exposed.any():
+            continue
+        corners = positions[exposed][:, np.newaxis, :] + FACE_CORNERS[face]
+        vertices.append(corners.reshape(-1))
+        tex_coords.append(TEXTURES[snapshot.types[exposed], face].reshape(-1))
+    if not vertices:
+        return Mesh(snapshot.chunk, snapshot.version, 0, array('f'),
+                    array('f'))
+    vertices = np.concatenate(vertices).astype(np.float32)
+    tex_coords = np.concatenate(tex_coords).astype(np.float32)
+    return Mesh(snapshot.chunk, snapshot.version, len(vertices) // 3,
+                array('f', vertices.tobytes()),
+                array('f', tex_coords.tobytes()))
+
+
+class MeshBuilder(object):
+    """Builds chunk meshes in worker threads.
+
+    Snapshots are submitted from the main thread, the finished meshes are
+    collected with get so they can be uploaded on the OpenGL thread.
+
+    Attributes:
+        pending: The number of submitted snapshots that have not been
+            collected yet.
+    """
+    def __init__(self, num_workers=2):
+        self.jobs = Queue()
+        self.results = Queue()
+        self.pending = 0
+        for i in xrange(num_workers):
+            worker = threading.Thread(target=self._work)
+            worker.daemon = True
+            worker.start()
+
+    def submit(self, snapshot):
+        """Queues a snapshot to be turned into a mesh.
+        """
+        self.pending += 1
+        self.jobs.put(snapshot)
+
+    def get(self, timeout=0):
+        """Returns a finished mesh.
+
+        Args:
+            timeout: How many seconds to wait for a mesh to finish.
+
+        Returns:
+            A tuple (chunk, mesh), mesh is None if building the mesh of the
+            chunk failed.
+
+        Raises:
+            Empty: No mesh was finished in time.
+        """
+        if timeout > 0:
+            mesh = self.results.get(True, timeout)
+        else:
+            mesh = self.results.get(False)
+        self.pending -= 1
+        return mesh
+
+    def _work(self):
+        while True:
+            snapshot = self.jobs.get()
+            try:
+                mesh = build_mesh(snapshot)
+            except Exception:
+                traceback.print_exc()
+                mesh = None
+            self.results.put((snapshot.chunk, mesh))
@@ -1,16 +1,21 @@
 import math
 import random
+from libc.math cimport floor
 
 
-cdef double noise(double x, double y, double z):
+cdef double noise(double x, double y, double z, int *p):
     """Ported from http://mrl.nyu.edu/~perlin/noise/
     """
-    cdef int X = int(x % 255)
-    cdef int Y = int(y % 255)
-    cdef int Z = int(z % 255)
-    x -= int(x)
-    y -= int(y)
-    z -= int(z)
+    # Use floor instead of int, int rounds negative coordinates the wrong way
+    cdef double x_floor = floor(x)
+    cdef double y_floor = floor(y)
+    cdef double z_floor = floor(z)
+    cdef int X = int(x_floor % 255)
+    cdef int Y = int(y_floor % 255)
+    cdef int Z = int(z_floor % 255)
+    x -= x_floor
+    y -= y_floor
+    z -= z_floor
     cdef double u = fade(x)
     cdef double v = fade(y)
     cdef double w = fade(z)
@@ -67,13 +72,44 @@ p = 2*[151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
        29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180]
 
 
+cdef class Noise(object):
+    """Perlin noise with its own permutation table.
+
+    Every instance has its own table, so noise with different seeds can be
+    used at the same time.
+    """
+    cdef int p[512]
+
+    def __init__(self, seed=None):
+        """Shuffles the permutation table with the given seed.
+
+        The same seed always gives the same noise. Without a seed the table
+        from the original implementation is used.
+        """
+        if seed is None:
+            permutation = p[:256]
+        else:
+            permutation = list(range(256))
+            random.Random(seed).shuffle(permutation)
+        for i in range(512):
+            self.p[i] = permutation[i % 256]
+
+    cpdef double fbm(self, double x, double y, double z, int octaves=8,
+                     double lacunarity=1.0, double gain=0.5):
+        cdef double amplitude = 1.0
+        cdef double frequency = 1.0
+        cdef double accum = 0.0
+        for i in range(octaves):
+            accum += amplitude * noise(x * frequency, y * frequency,
+                                       z * frequency, self.p)
+            amplitude *= gain
+            frequency *= lacunarity
+        return accum
+
+
+cdef Noise default_noise = Noise()
+
+
 cpdef double fbm(double x, double y, double z, int octaves=8,
                  double lacunarity=1.0, double gain=0.5):
-    cdef double amplitude = 1.0
-    cdef double frequency = 1.0
-    cdef double accum = 0.0
-    for i in range(octaves):
-        accum += amplitude * noise(x * frequency, y * frequency, z * frequency)
-        amplitude *= gain
-        frequency *= lacunarity
-    return accum
+    return default_noise.fbm(x, y, z, octaves, lacunarity, gain)
@@ -1,7 +1,7 @@
 import math
 from pyglet.window import key, mouse
 from utils import clamp
-from blocks import GrassBlock
+from blocks import GrassBlock, DirtBlock, SandBlock, StoneBlock, BrickBlock
 
 
 class Player(object):
@@ -15,6 +15,7 @@ class Player(object):
         position: The current position of the player.
         active_block: The current active block. The active block is the block
             which is placed when the player rightclicks.
+        block_keys: The keys used to select each type of active block.
     """
     def __init__(self, position=(0, 0, 0)):
         self.height = 2  # Height in number of blocks
@@ -23,6 +24,9 @@ class Player(object):
         self.rotation_speed = 0.25
         self.position = position
         self.active_block = GrassBlock()
+        self.block_keys = {key._1: GrassBlock, key._2: DirtBlock,
+                           key._3: SandBlock, key._4: StoneBlock,
+                           key._5: BrickBlock}
 
     def camera_direction(self):
         """Gets a vector in which the player is looking
@@ -53,7 +57,7 @@ class Player(object):
         self.update_position(dt)
 
     def on_key_press(self, pressed_key, modifiers):
-        """Increase velocity on keypress.
+        """Increase velocity on keypress or select the active block.
         """
         if pressed_key == key.W:
             self.velocity[0] -= 1
@@ -66,6 +70,8 @@ class Player(object):
         elif pressed_key == key.SPACE:
             if self.velocity[1] == 0:
                 self.velocity[1] = 1.0
+        elif pressed_key in self.block_keys:
+            self.active_block = self.block_keys[pressed_key]()
 
     def on_key_release(self, pressed_key, modifiers):
         """Decrease velocity on key release.
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+import numpy as np
+from utils import clamp
+
+
+class HeightmapCache(object):
+    """A bounded cache of chunk heightmaps.
+
+    When the cache is full the heightmap that was used least recently is
+    dropped.
+
+    Attributes:
+        capacity: The maximum number of heightmaps in the cache.
+        hits: The number of times a heightmap was found in the cache.
+        misses: The number of times a heightmap had to be computed.
+    """
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._heightmaps = OrderedDict()
+
+    def __len__(self):
+        return len(self._heightmaps)
+
+    def get(self, key, compute):
+        """Returns the heightmap for a key.
+
+        Args:
+            key: The key of the heightmap, usually the seed, the terrain
+                parameters and the chunk.
+            compute: A function returning the heightmap, called when it is
+                not in the cache.
+
+        Returns:
+            The heightmap.
+        """
+        heightmap = self._heightmaps.pop(key, None)
+        if heightmap is None:
+            self.misses += 1
+            heightmap = compute()
+            if len(self._heightmaps) >= self.capacity:
+                self._heightmaps.popitem(last=False)
+        else:
+            self.hits += 1
+        self._heightmaps[key] = heightmap
+        return heightmap
+
+
+# Heightmaps are keyed by seed and terrain parameters and every world has its
+# own noise, so all worlds can share one cache.
+heightmap_cache = HeightmapCache()
+
+
+def surface_heights(noise, x0, z0, size, smoothness, base_height,
+                    max_height):
+    """Generates the terrain height of each column in a chunk.
+
+    Args:
+        noise: The Noise used to generate the terrain.
+        x0: The x position of the first column.
+        z0: The z position of the first column.
+        size: The number of columns along the x and z axis.
+        smoothness: How smooth the terrain is.
+        base_height: The lowest height of the terrain.
+        max_height: How far the terrain can rise above base_height.
+
+    Returns:
+        A read-only (size, size) array with the height of each column.
+    """
+    heights = np.empty((size, size), dtype=np.int32)
+    for i in xrange(size):
+        x = (x0 + i) / smoothness
+        for j in xrange(size):
+            z = (z0 + j) / smoothness
+            heights[i, j] = base_height + int(max_height*clamp(
+                0, noise.fbm(x, z, 0), 1))
+    heights.flags.writeable = False
+    return heights
+
+
+def noise_field(noise, x0, y0, z0, shape, step=4, scale=24.0):
+    """Samples 3D noise for a box of blocks.
+
+    The noise is only evaluated on a lattice with a point every `step` blocks,
+    the values in between are trilinearly interpolated.
+
+    Args:
+        noise: The Noise to sample.
+        x0: The x position of the first block.
+        y0: The y position of the first block.
+        z0: The z position of the first block.
+        shape: The number of blocks along the x, y and z axis.
+        step: The distance in blocks between two lattice points.
+        scale: How many blocks one unit of noise covers.
+
+    Returns:
+        An array of the given shape with the noise value of each block.
+    """
+    lattice_shape = [(size - 1) // step + 2 for size in shape]
+    lattice = np.empty(lattice_shape)
+    for i in xrange(lattice_shape[0]):
+        x = (x0 + i*step) / scale
+        for j in xrange(lattice_shape[1]):
+            y = (y0 + j*step) / scale
+            for k in xrange(lattice_shape[2]):
+                lattice[i, j, k] = noise.fbm(x, y, (z0 + k*step) / scale)
+    # Interpolate one axis at a time, moving it to the front so the same
+    # code works for every axis.
+    field = lattice
+    for axis, size in enumerate(shape):
+        field = np.rollaxis(field, axis)
+        offsets = np.arange(size)
+        below = offsets // step
+        t = (offsets % step / float(step)).reshape((-1,) + (1,)*(field.ndim-1))
+        field = field[below] * (1 - t) + field[below + 1] * t
+        field = np.rollaxis(field, 0, axis + 1)
+    return field
+
+
+def naive_noise_field(noise, x0, y0, z0, shape, scale=24.0):
+    """Evaluates 3D noise for every block in a box.
+
+    This gives the exact values noise_field approximates, it is only used to
+    compare against.
+    """
+    field = np.empty(shape)
+    for i in xrange(shape[0]):
+        for j in xrange(shape[1]):
+            for k in xrange(shape[2]):
+                field[i, j, k] = noise.fbm((x0 + i) / scale,
+                                           (y0 + j) / scale,
+                                           (z0 + k) / scale)
+    return field
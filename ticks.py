@@ -0,0 +1,123 @@
+import heapq
+import random
+import time
+
+
+class TickScheduler(object):
+    """Runs block updates at a fixed number of ticks per second.
+
+    Blocks can schedule an update a number of ticks in the future, these are
+    kept in a priority queue ordered by tick. Every tick a few random blocks
+    in each active chunk get a random update as well. Updates that do not fit
+    in the time budget of a frame are left in the queue for the next frame.
+
+    Attributes:
+        tick: The current tick.
+        tick_length: The number of seconds between two ticks.
+        random_ticks_per_chunk: The number of random blocks in each active
+            chunk that get a random update every tick.
+        max_ticks_per_update: The maximum number of ticks we advance in one
+            update, so we do not fall further behind after a slow frame.
+        sample_ticks: The minimum number of ticks between two refreshes of
+            the blocks random ticks pick from in a chunk.
+    """
+    def __init__(self, ticks_per_sec=20, random_ticks_per_chunk=3,
+                 max_ticks_per_update=3):
+        self.tick = 0
+        self.sample_ticks = ticks_per_sec
+        self.tick_length = 1.0 / ticks_per_sec
+        self.random_ticks_per_chunk = random_ticks_per_chunk
+        self.max_ticks_per_update = max_ticks_per_update
+        self.queue = []
+        self.scheduled = set()
+        self.time = 0.0
+        self.order = 0
+        self.samples = {}
+
+    def __len__(self):
+        return len(self.queue)
+
+    def schedule(self, position, delay, random_tick=False):
+        """Schedules an update of the block at a position.
+
+        A block is only scheduled once for the same tick.
+
+        Args:
+            position: The position of the block.
+            delay: The number of ticks until the update.
+            random_tick: Whether this is a random update.
+        """
+        tick = self.tick + delay
+        if (tick, position, random_tick) in self.scheduled:
+            return
+        self.scheduled.add((tick, position, random_tick))
+        # The order makes sure updates of the same tick run in the order
+        # they were scheduled.
+        self.order += 1
+        heapq.heappush(self.queue, (tick, self.order, position, random_tick))
+
+    def schedule_random_ticks(self, world):
+        """Picks random blocks in the active chunks to update this tick.
+
+        The blocks of a chunk are kept in a set, so we pick from a tuple of
+        them. Copying the blocks of a chunk is slow, so when the chunk changes
+        the tuple is rebuilt at most once every sample_ticks ticks. Until
+        then blocks that were removed are skipped and new blocks are not
+        picked.
+        """
+        samples = {}
+        for chunk in world.drawn_chunks:
+            positions = world.chunks.get(chunk)
+            if not positions:
+                continue
+            version = world.chunk_versions.get(chunk, 0)
+            sample = self.samples.get(chunk)
+            if sample is None or (sample[1] != version and
+                                  self.tick - sample[0] >= self.sample_ticks):
+                sample = (self.tick, version, tuple(positions))
+            samples[chunk] = sample
+            for i in xrange(self.random_ticks_per_chunk):
+                position = random.choice(sample[2])
+                block = world.blocks.get(position)
+                if block is not None and block.random_ticks:
+                    self.schedule(position, 0, True)
+        self.samples = samples
+
+    def update(self, world, dt, max_time):
+        """Advances the ticks and runs the updates that are due.
+
+        Args:
+            world: The world containing the blocks.
+            dt: The time elapsed since the last update.
+            max_time: The maximum number of seconds we can spend on updates.
+
+        Returns:
+            The number of updates that were run.
+        """
+        start = time.clock()
+        self.time += dt
+        num_ticks = 0
+        while self.time >= self.tick_length:
+            self.time -= self.tick_length
+            if num_ticks < self.max_ticks_per_update:
+                self.tick += 1
+                num_ticks += 1
+                self.schedule_random_ticks(world)
+        num_updates = 0
+        queue = self.queue
+        while (queue and queue[0][0] <= self.tick and
+               time.clock()-start < max_time):
+            tick, order, position, random_tick = heapq.heappop(queue)
+            self.scheduled.discard((tick, position, random_tick))
+            # Updates read the block and its neighbors, which may be in a
+            # compressed chunk.
+            world.expand_around(world.chunk_position(position))
+            block = world.blocks.get(position)
+            if block is None:
+                continue
+            if random_tick:
+                block.random_tick(world, position)
+            else:
+                block.scheduled_tick(world, position)
+            num_updates += 1
+        return num_updates
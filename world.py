@@ -1,10 +1,17 @@
+import gc
 import random
 import time
+import numpy as np
 from pyglet.gl import *
 from pyglet.graphics import TextureGroup
 from pyglet import image
 from collections import deque
+from Queue import Empty
 from blocks import *
+from compression import CompressedChunk
+from meshing import ChunkSnapshot, MeshBuilder
+from terrain import noise_field, surface_heights, heightmap_cache
+from ticks import TickScheduler
 from utils import *
 from noise import *
 
@@ -13,18 +20,47 @@ class World(object):
     """Represents the logic and rendering of the world
 
     The world is made of chunks which each contain blocks. The world keeps
-    track of which chunks/blocks are visible and drawn. It is also responsible
-    for generating terrain.
+    track of which chunks are visible and drawn. Each drawn chunk has a single
+    mesh which is built in worker threads. It is also responsible for
+    generating terrain.
+
+    The terrain only depends on the seed, so a chunk is always generated the
+    same way and chunks fit seamlessly together.
     """
-    def __init__(self):
+    def __init__(self, seed=None):
         self.CHUNK_SIZE = 16
+        self.SMOOTHNESS = 25.0
+        self.BASE_HEIGHT = 12
+        self.MAX_HEIGHT = 10
+        self.HEIGHT_LIMIT = 32
+        self.FALLOFF = 3.0
+        self.CAVE_WIDTH = 0.1
+        self.DRAW_RADIUS = 4
+        self.COMPRESS_RADIUS = self.DRAW_RADIUS + 2
+        if seed is None:
+            seed = random.randint(0, 2**31 - 1)
+        self.seed = seed
+        self.noise = Noise(seed)
+        self.heightmap_cache = heightmap_cache
+        self.NO_SURFACE = np.iinfo(np.int32).min
         self.batch = pyglet.graphics.Batch()
         self.group = TextureGroup(image.load('texture.png').get_texture())
         self.blocks = {}
-        self.drawn_blocks = {}
+        self.drawn_chunks = set()
+        self.dirty_chunks = set()
+        self.chunk_versions = {}
         self.vertex_lists = {}
+        self.mesh_builder = MeshBuilder()
+        self.ticks = TickScheduler()
         self.chunks = {}
+        self.heightmaps = {}
+        self.occupancy = {}
+        self.lowest_y = 0
         self.chunks_generated = set()
+        self.compressed = {}
+        self.compression_stats = {'chunks': 0, 'raw_nbytes': 0, 'nbytes': 0,
+                                  'decompressions': 0,
+                                  'decompress_time': 0.0}
         self.current_chunk = (float('inf'), float('inf'), float('inf'))
         self.drawing_queue = deque()
         self.generation_queue = deque()
@@ -39,70 +75,338 @@ class World(object):
                 new_pos[axis] += direction
                 yield tuple(new_pos)
 
-    def exposed(self, position):
-        """Returns whether a position is exposed.
-
-        A position is exposed when each of its neighbors are drawn
-        """
-        for neighbor in self.neighbors(position):
-            if neighbor not in self.blocks:
-                    return True
-        return False
-
     def add_block(self, position, block_type, urgent=True):
         """Adds a block to the world
 
         Args:
             position: The position of the new block.
             block_type: The type of the block.
-            urgent: Whether we should draw the block immediately.
+            urgent: Whether this is a change to existing terrain, in which
+                case the adjacent chunks are expanded and the block and its
+                neighbors are scheduled for an update.
         """
+        chunk = self.chunk_position(position)
+        if urgent:
+            self.expand_around(chunk)
+        else:
+            self.expand_chunk(chunk)
         if position in self.blocks:
             self.remove_block(position)
         self.blocks[position] = block_type
-        self.chunks.setdefault(self.chunk_position(position),
-                               []).append(position)
+        self.chunks.setdefault(chunk, set()).add(position)
+        self._set_occupied(chunk, position, True)
+        x, y, z = position
+        heightmap = self._heightmap(chunk)
+        i, j = x % self.CHUNK_SIZE, z % self.CHUNK_SIZE
+        heightmap[i, j] = max(heightmap[i, j], y)
+        self.lowest_y = min(self.lowest_y, y)
+        self.chunk_changed(position)
         if urgent:
-            if self.exposed(position):
-                self.draw_block(position)
-            self.redraw_neighbors(position)
+            self.schedule_neighbors(position)
 
     def remove_block(self, position, urgent=True):
         """Removes a block from the world
 
         Args:
             position: The position of the block to be removed.
-            urgent: Whether we should undraw the block immediately.
+            urgent: Whether this is a change to existing terrain, in which
+                case the adjacent chunks are expanded and the neighbors of the
+                block are scheduled for an update.
         """
+        chunk = self.chunk_position(position)
+        if urgent:
+            self.expand_around(chunk)
+        else:
+            self.expand_chunk(chunk)
         if position not in self.blocks:
             return
         del self.blocks[position]
-        self.chunks[self.chunk_position(position)].remove(position)
+        self.chunks[chunk].remove(position)
+        self._set_occupied(chunk, position, False)
+        x, y, z = position
+        heightmap = self.heightmaps[chunk]
+        i, j = x % self.CHUNK_SIZE, z % self.CHUNK_SIZE
+        if heightmap[i, j] == y:
+            heightmap[i, j] = self.NO_SURFACE
+            for below in xrange(y-1, self.lowest_y-1, -1):
+                if (x, below, z) in self.blocks:
+                    heightmap[i, j] = below
+                    break
+        self.chunk_changed(position)
         if urgent:
-            if position in self.drawn_blocks:
-                self.undraw_block(position)
-            self.redraw_neighbors(position)
+            self.schedule_neighbors(position)
+
+    def schedule_neighbors(self, position):
+        """Schedules an update for a block and its neighbors.
+
+        Only blocks with a tick_delay are scheduled.
+
+        Args:
+            position: The position of the block that changed.
+        """
+        for neighbor in [position] + list(self.neighbors(position)):
+            block = self.blocks.get(neighbor)
+            if block is not None and block.tick_delay:
+                self.ticks.schedule(neighbor, block.tick_delay)
+
+    def simulate(self, dt, max_time):
+        """Runs the block updates that are due.
+
+        This should run before update, so all chunks changed by the updates
+        are remeshed at most once.
+
+        Args:
+            dt: The time elapsed since the last step.
+            max_time: The maximum number of seconds we can spend on updates.
+
+        Returns:
+            The number of updates that were run.
+        """
+        return self.ticks.update(self, dt, max_time)
+
+    def surface_height(self, x, z):
+        """Returns the y position of the highest block at x, z.
+
+        Returns:
+            The height, or None if there is no block in the column.
+        """
+        x, _, z = discretize((x, 0, z))
+        chunk = self.chunk_position((x, 0, z))
+        heightmap = self.heightmaps.get(chunk)
+        if heightmap is None:
+            return None
+        height = heightmap[x % self.CHUNK_SIZE, z % self.CHUNK_SIZE]
+        if height == self.NO_SURFACE:
+            return None
+        return int(height)
+
+    def surface_height_many(self, columns):
+        """Vectorized version of surface_height.
+
+        Args:
+            columns: An (N, 2) integer array with the x and z position of
+                each column.
+
+        Returns:
+            An array of length N with the y position of the highest block in
+            each column, or NO_SURFACE if the column is empty or its chunk
+            was never generated.
+        """
+        size = self.CHUNK_SIZE
+        chunks, inverse = self._chunk_indices(columns)
+        stacked = np.empty((len(chunks), size, size), dtype=np.int32)
+        stacked.fill(self.NO_SURFACE)
+        for index, chunk in enumerate(chunks):
+            heightmap = self.heightmaps.get(chunk)
+            if heightmap is not None:
+                stacked[index] = heightmap
+        return stacked[inverse, columns[:, 0] % size, columns[:, 1] % size]
+
+    def chunk_heightmap(self, chunk):
+        """Returns the heightmap of a chunk.
+
+        Args:
+            chunk: The chunk to get the heightmap for.
+
+        Returns:
+            A (CHUNK_SIZE, CHUNK_SIZE) array indexed by the x and z position
+            within the chunk, or None if the chunk was never generated. It
+            contains the y position of the highest block in each column, or
+            NO_SURFACE if the column is empty.
+        """
+        heightmap = self.heightmaps.get(chunk)
+        if heightmap is None:
+            return None
+        return heightmap.copy()
+
+    def _heightmap(self, chunk):
+        """Returns the heightmap of a chunk, creating it if needed.
+
+        The heightmap is kept up to date when blocks are added or removed.
+        """
+        heightmap = self.heightmaps.get(chunk)
+        if heightmap is None:
+            heightmap = np.empty((self.CHUNK_SIZE, self.CHUNK_SIZE),
+                                 dtype=np.int32)
+            heightmap.fill(self.NO_SURFACE)
+            self.heightmaps[chunk] = heightmap
+        return heightmap
+
+    def _set_occupied(self, chunk, position, occupied):
+        """Updates the occupancy array of a chunk.
+
+        The occupancy array of a chunk is a dense (CHUNK_SIZE, height,
+        CHUNK_SIZE) boolean array telling which blocks of the chunk exist,
+        starting at a bottom y position. It is kept as a tuple (bottom,
+        array) and grows in steps of CHUNK_SIZE when a block is added outside
+        of it.
+
+        Args:
+            chunk: The chunk containing the position.
+            position: The position of the block.
+            occupied: Whether the position contains a block.
+        """
+        x, y, z = position
+        size = self.CHUNK_SIZE
+        bottom, array = self.occupancy.get(chunk, (0, None))
+        if array is None:
+            array = np.zeros((size, self.HEIGHT_LIMIT, size), dtype=bool)
+        if not bottom <= y < bottom + array.shape[1]:
+            if not occupied:
+                return
+            below = max(bottom - y, 0)
+            above = max(y + 1 - bottom - array.shape[1], 0)
+            below = -(-below // size) * size
+            above = -(-above // size) * size
+            array = np.pad(array, ((0, 0), (below, above), (0, 0)),
+                           'constant')
+            bottom -= below
+        self.occupancy[chunk] = (bottom, array)
+        array[x % size, y - bottom, z % size] = occupied
 
     def draw_chunk(self, chunk):
-        """Draws all visible blocks in a chunk.
+        """Draws a chunk.
+
+        The mesh of the chunk is built in the background and uploaded in
+        update. Chunks near the drawn chunks are expanded ahead of time by
+        change_chunk and adjacent chunks are only read through their
+        occupancy arrays, so drawing does not decompress anything.
 
         Args:
             chunk: The chunk to draw.
         """
         self.generate_chunk(chunk)
-        for position in self.chunks.get(chunk, []):
-            if position not in self.drawn_blocks and self.exposed(position):
-                self.draw_block(position, False)
+        self.drawn_chunks.add(chunk)
+        self.mark_dirty(chunk)
 
     def undraw_chunk(self, chunk):
-        """Undraw all blocks in a chunk.
+        """Undraws a chunk.
 
         Args:
             chunk: The chunk to undraw.
         """
-        for position in self.chunks.get(chunk, []):
-            if position in self.drawn_blocks:
-                self.undraw_block(position, False)
+        self.drawn_chunks.discard(chunk)
+        self.dirty_chunks.discard(chunk)
+        if chunk in self.vertex_lists:
+            self.vertex_lists.pop(chunk).delete()
+
+    def chunk_changed(self, position):
+        """Registers that the block at a position was added or removed.
+
+        The version of the chunk containing the block is increased, so meshes
+        that are being built from an older snapshot are discarded. When the
+        block is at the border of its chunk, the adjacent chunk changes too
+        because its mesh depends on the blocks next to it.
+
+        Args:
+            position: The position of the block.
+        """
+        chunk = self.chunk_position(position)
+        changed = [chunk]
+        x, y, z = position
+        cx, cy, cz = chunk
+        last = self.CHUNK_SIZE - 1
+        if x % self.CHUNK_SIZE == 0:
+            changed.append((cx - 1, cy, cz))
+        elif x % self.CHUNK_SIZE == last:
+            changed.append((cx + 1, cy, cz))
+        if z % self.CHUNK_SIZE == 0:
+            changed.append((cx, cy, cz - 1))
+        elif z % self.CHUNK_SIZE == last:
+            changed.append((cx, cy, cz + 1))
+        for chunk in changed:
+            self.chunk_versions[chunk] = self.chunk_versions.get(chunk, 0) + 1
+            self.mark_dirty(chunk)
+
+    def mark_dirty(self, chunk):
+        """Queues a drawn chunk to get a new mesh.
+
+        A chunk is queued at most once, no matter how many of its blocks
+        change before the queue gets to it.
+
+        Args:
+            chunk: The chunk that changed.
+        """
+        if chunk not in self.drawn_chunks or chunk in self.dirty_chunks:
+            return
+        self.dirty_chunks.add(chunk)
+        self.drawing_queue.append((self._build_mesh, (chunk,)))
+
+    def _build_mesh(self, chunk):
+        """Sends a snapshot of a dirty chunk to the mesh builder.
+        """
+        if chunk not in self.dirty_chunks:
+            return
+        self.dirty_chunks.discard(chunk)
+        # Only needed when the chunk was not expanded ahead of time, for
+        # example after jumping far away.
+        self.expand_chunk(chunk)
+        self.mesh_builder.submit(self.snapshot_chunk(chunk))
+
+    def snapshot_chunk(self, chunk):
+        """Copies everything needed to build the mesh of a chunk.
+
+        Only the blocks of adjacent chunks that touch a block of this chunk
+        are copied, the others do not change the mesh. They are looked up in
+        the occupancy arrays, so adjacent chunks can stay compressed.
+
+        Args:
+            chunk: The chunk to take a snapshot of.
+
+        Returns:
+            A ChunkSnapshot that can be used from another thread.
+        """
+        blocks = self.blocks
+        positions = list(self.chunks.get(chunk, ()))
+        types = np.fromiter((blocks[position].id for position in positions),
+                            dtype=np.int64, count=len(positions))
+        positions = np.array(positions, dtype=np.int64).reshape(-1, 3)
+        x, y, z = chunk
+        origin = (x*self.CHUNK_SIZE, 0, z*self.CHUNK_SIZE)
+        last = self.CHUNK_SIZE - 1
+        cells = []
+        for axis, edge, direction in [(0, 0, -1), (0, last, 1), (2, 0, -1),
+                                      (2, last, 1)]:
+            outside = positions[positions[:, axis] - origin[axis] == edge]
+            outside[:, axis] += direction
+            cells.append(outside)
+        cells = np.concatenate(cells)
+        occupied = self.solid_mask(cells)
+        return ChunkSnapshot(chunk, self.chunk_versions.get(chunk, 0),
+                             self.CHUNK_SIZE, positions, types,
+                             cells[occupied])
+
+    def upload_mesh(self, timeout=0):
+        """Uploads a mesh that was built in the background.
+
+        Meshes of chunks that are no longer drawn, or that changed since the
+        snapshot was taken, are discarded. A chunk whose mesh failed to build
+        is queued again, otherwise it would stay invisible until it changes.
+
+        Args:
+            timeout: How many seconds to wait for a mesh to finish.
+
+        Returns:
+            Whether a mesh was finished.
+        """
+        try:
+            chunk, mesh = self.mesh_builder.get(timeout)
+        except Empty:
+            return False
+        if mesh is None:
+            self.mark_dirty(chunk)
+            return True
+        if (mesh.chunk not in self.drawn_chunks or
+                mesh.version != self.chunk_versions.get(mesh.chunk, 0)):
+            return True
+        if mesh.chunk in self.vertex_lists:
+            self.vertex_lists.pop(mesh.chunk).delete()
+        if mesh.count:
+            vertex_list = self.batch.add(mesh.count, GL_QUADS, self.group,
+                                         ('v3f/static', mesh.vertices),
+                                         ('t2f/static', mesh.tex_coords))
+            self.vertex_lists[mesh.chunk] = vertex_list
+        return True
 
     def change_chunk(self, new_chunk):
         """Changes the current chunk
@@ -117,7 +421,7 @@ class World(object):
         """
         curr_chunks_visible = set()
         new_chunks_visible = set()
-        num_adjacent_drawn = 4
+        num_adjacent_drawn = self.DRAW_RADIUS
         for dx in xrange(-num_adjacent_drawn, num_adjacent_drawn + 1):
             # for dy in xrange(-num_adjacent_drawn, num_adjacent_drawn + 1):
             # Infinte height for the moment to help with terrain generation
@@ -136,6 +440,23 @@ class World(object):
             self.undraw_chunk(chunk)
         for chunk in draw:
             self.draw_chunk(chunk)
+        self.current_chunk = new_chunk
+        # The ring of chunks just outside the drawn chunks is expanded in the
+        # queue before any new terrain is generated, so those chunks are
+        # ready before we get close enough to draw them. Only chunks from
+        # COMPRESS_RADIUS on are compressed, so crossing a chunk border
+        # never has to decompress a chunk on the spot.
+        x, y, z = new_chunk
+        num_expanded = self.COMPRESS_RADIUS - 1
+        for dx in xrange(-num_expanded, num_expanded + 1):
+            for dz in xrange(-num_expanded, num_expanded + 1):
+                chunk = (x + dx, y, z + dz)
+                if chunk in self.compressed:
+                    self.generation_queue.append((self.expand_chunk,
+                                                  (chunk,)))
+        for chunk in self.chunks:
+            if self.chunk_distance(chunk) >= self.COMPRESS_RADIUS:
+                self.generation_queue.append((self.compress_chunk, (chunk,)))
         # There can occur an condition that the terrain is being generated
         # (in the queue) but that we need it now, to draw. We could then do
         # terrain generation on the spot and remove it from the queue. It felt
@@ -147,87 +468,94 @@ class World(object):
                     x, y, z = new_chunk
                     params = ((x + dx, y, z + dz), False)
                     self.generation_queue.append((self.generate_chunk, params))
-        self.current_chunk = new_chunk
 
-    def load_chunks(self, position):
-        """Loads a chunk.
-
-        If the currently loaded chunk is different than the chunk associated
-        with the given position the new chunk is loaded.
+    def chunk_distance(self, chunk):
+        """Returns how many chunks away a chunk is from the current chunk.
 
-        Args:
-            position: The position for which you want to load the associated
-                chunk.
+        A diagonal step counts as one, so all chunks at the same distance
+        form a square ring.
         """
-        new_chunk = self.chunk_position(position)
-        if self.current_chunk != new_chunk:
-            self.change_chunk(new_chunk)
+        x, y, z = chunk
+        cx, cy, cz = self.current_chunk
+        return max(abs(x - cx), abs(z - cz))
 
-    def redraw_neighbors(self, position):
-        """Redraws the neighbors of a block
+    def compress_chunk(self, chunk):
+        """Compresses a chunk that is far from the current chunk.
 
-        If the neighbor is exposed it is drawn. If is not it is undrawn.
+        The blocks of the chunk are removed from the world and kept in
+        compressed form until the chunk is expanded again. Chunks closer
+        than COMPRESS_RADIUS are not compressed, because they are drawn or
+        about to be drawn.
 
         Args:
-            position: The position of a block.
-        """
-        for neighbor in self.neighbors(position):
-            if neighbor not in self.blocks:
-                continue
-            if neighbor in self.drawn_blocks:
-                if not self.exposed(neighbor):
-                    self.undraw_block(neighbor)
-            else:
-                if self.exposed(neighbor):
-                    self.draw_block(neighbor)
-
-    def draw_block(self, position, urgent=True):
-        """Draws a block.
-
-        If it's urgent the block is drawn immediately, otherwise it is added
-        to the drawing queue.
+            chunk: The chunk to compress.
+        """
+        if chunk in self.compressed or not self.chunks.get(chunk):
+            return
+        if self.chunk_distance(chunk) < self.COMPRESS_RADIUS:
+            return
+        positions = list(self.chunks.pop(chunk))
+        blocks = [self.blocks.pop(position) for position in positions]
+        compressed = CompressedChunk(positions, blocks)
+        self.compressed[chunk] = compressed
+        stats = self.compression_stats
+        stats['chunks'] += 1
+        stats['raw_nbytes'] += compressed.raw_nbytes
+        stats['nbytes'] += compressed.nbytes
+
+    def expand_chunk(self, chunk):
+        """Decompresses a chunk if it is compressed.
 
         Args:
-            position: The position of the block to be drawn.
-            urgent: Whether we should draw the block immediately.
+            chunk: The chunk to decompress.
         """
-        self.drawn_blocks[position] = self.blocks[position]
-        if urgent:
-            self._draw_block(position)
-        else:
-            self.drawing_queue.append((self._draw_block, (position,)))
+        if chunk not in self.compressed:
+            return
+        start = time.clock()
+        compressed = self.compressed.pop(chunk)
+        # Creating thousands of position tuples makes the garbage collector
+        # run, which then scans every block in the world.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            positions, blocks = compressed.decompress()
+            self.blocks.update(zip(positions, blocks))
+            self.chunks.setdefault(chunk, set()).update(positions)
+        finally:
+            if collecting:
+                gc.enable()
+        stats = self.compression_stats
+        stats['chunks'] -= 1
+        stats['raw_nbytes'] -= compressed.raw_nbytes
+        stats['nbytes'] -= compressed.nbytes
+        stats['decompressions'] += 1
+        stats['decompress_time'] += time.clock() - start
+
+    def expand_around(self, chunk):
+        """Decompresses a chunk and the chunks next to it.
 
-    def _draw_block(self, position):
-        """ Draw block at `position`"""
-        block = self.blocks.get(position, None)
-        if not block or position in self.vertex_lists:
+        Args:
+            chunk: The chunk in the middle.
+        """
+        if not self.compressed:
             return
-        vertices = Block.cube_vertices(*position)
-        texture = block.texture_data
-        vertex_list = self.batch.add(24, GL_QUADS, self.group,
-                                     ('v3f/static', vertices),
-                                     ('t2f/static', texture))
-        self.vertex_lists[position] = vertex_list
+        x, y, z = chunk
+        for dx, dz in [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]:
+            self.expand_chunk((x + dx, y, z + dz))
 
-    def undraw_block(self, position, urgent=True):
-        """Undraws a block.
+    def load_chunks(self, position):
+        """Loads a chunk.
 
-        If it's urgent the block is undrawn immediately, otherwise it is added
-        to the drawing queue.
+        If the currently loaded chunk is different than the chunk associated
+        with the given position the new chunk is loaded.
 
         Args:
-            position: The position of the block to be undrawn.
-            urgent: Whether we should undraw the block immediately.
+            position: The position for which you want to load the associated
+                chunk.
         """
-        del self.drawn_blocks[position]
-        if urgent:
-            self._undraw_block(position)
-        else:
-            self.drawing_queue.append((self._undraw_block, (position,)))
-
-    def _undraw_block(self, position):
-        if position in self.vertex_lists:
-            self.vertex_lists.pop(position).delete()
+        new_chunk = self.chunk_position(position)
+        if self.current_chunk != new_chunk:
+            self.change_chunk(new_chunk)
 
     def draw(self):
         """Draws all the blocks in the batch.
@@ -237,7 +565,9 @@ class World(object):
     def update(self, max_time):
         """Updates the world
 
-        Empties the drawing and generation queues for max_time seconds maximum.
+        Empties the drawing and generation queues and uploads finished meshes
+        for max_time seconds maximum. If max_time is infinite it also waits
+        for the meshes that are still being built.
 
         Args:
             max_time: The maximum number of milliseconds we can update
@@ -250,8 +580,13 @@ class World(object):
                     func, args = queue.popleft()
                     func(*args)
                     all_empty = False
+            if self.upload_mesh():
+                all_empty = False
             if all_empty:
-                return
+                if (not self.mesh_builder.pending or
+                        max_time != float('inf')):
+                    return
+                self.upload_mesh(0.01)
 
     def collides(self, obj):
         """Checks for a collision between a block and an object.
@@ -265,6 +600,7 @@ class World(object):
         Returns:
             Returns a new position where the object is after colliding.
         """
+        self.expand_around(self.chunk_position(obj.position))
         position = list(obj.position)
         height = obj.height
         max_overlap = 0.1
@@ -283,16 +619,87 @@ class World(object):
                         break
         return tuple(position)
 
+    def solid_mask(self, cells):
+        """Returns which of the given block positions contain a block.
+
+        The occupancy arrays of the chunks containing the positions are
+        stacked, so all positions are looked up with a single gather.
+        Compressed chunks do not have to be expanded for this.
+
+        Args:
+            cells: An (N, 3) integer array of block positions.
+
+        Returns:
+            A boolean array of length N.
+        """
+        size = self.CHUNK_SIZE
+        chunks, inverse = self._chunk_indices(cells[:, 0::2])
+        entries = [self.occupancy.get(chunk) for chunk in chunks]
+        known = [entry for entry in entries if entry is not None]
+        if not known:
+            return np.zeros(len(cells), dtype=bool)
+        bottom = min(lowest for lowest, occupied in known)
+        top = max(lowest + occupied.shape[1] for lowest, occupied in known)
+        stacked = np.zeros((len(chunks) + 1, size, top - bottom, size),
+                           dtype=bool)
+        for index, entry in enumerate(entries):
+            if entry is not None:
+                lowest, occupied = entry
+                lowest -= bottom
+                stacked[index, :, lowest:lowest + occupied.shape[1]] = \
+                    occupied
+        # Positions above or below all arrays look in the last, empty array.
+        ys = cells[:, 1] - bottom
+        outside = (ys < 0) | (ys >= top - bottom)
+        inverse[outside] = len(chunks)
+        ys[outside] = 0
+        return stacked[inverse, cells[:, 0] % size, ys, cells[:, 2] % size]
+
+    def _chunk_indices(self, columns):
+        """Finds the distinct chunks a number of columns are in.
+
+        Args:
+            columns: An (N, 2) integer array with the x and z position of
+                each column.
+
+        Returns:
+            A tuple (chunks, inverse) with a list of the distinct chunks and
+            an array with the index in that list of the chunk of each column.
+        """
+        if not len(columns):
+            return [], np.zeros(0, dtype=np.int64)
+        chunks = columns // self.CHUNK_SIZE
+        lowest = chunks.min(axis=0)
+        width, depth = chunks.max(axis=0) - lowest + 1
+        if width * depth <= 2**16:
+            # Usually the columns are close together, then every chunk in
+            # the area they cover gets a number and we count which are used.
+            keys = ((chunks[:, 0] - lowest[0]) * depth +
+                    chunks[:, 1] - lowest[1])
+            used = np.bincount(keys) > 0
+            inverse = (np.cumsum(used) - 1)[keys]
+            keys = np.nonzero(used)[0]
+            return [(int(lowest[0] + key // depth), 0,
+                     int(lowest[1] + key % depth)) for key in keys], inverse
+        inverse = np.zeros(len(columns), dtype=np.int64)
+        order = np.lexsort((chunks[:, 1], chunks[:, 0]))
+        chunks = chunks[order]
+        new = np.ones(len(chunks), dtype=bool)
+        new[1:] = np.any(chunks[1:] != chunks[:-1], axis=1)
+        inverse[order] = np.cumsum(new) - 1
+        return [(x, 0, z) for x, z in chunks[new].tolist()], inverse
+
     def occupied(self, position):
         """Returns whether a position contains a block.
         """
+        self.expand_chunk(self.chunk_position(position))
         return discretize(position) in self.blocks
 
     def generate_chunk(self, chunk, urgent=True):
         """Generates a chunk.
 
-        If urgent we generate the terrain immediately otherwise we add a call
-        to _generate_chunk in the queue for each x and z position in the chunk.
+        If urgent we add the blocks immediately otherwise we add the steps
+        computing which blocks are solid to the queue, see _generation_step.
 
         Args:
             chunk: The chunk to generate terrain for.
@@ -301,39 +708,151 @@ class World(object):
         if chunk in self.chunks_generated:
             return
         self.chunks_generated.add(chunk)
+        self._heightmap(chunk)
+        if urgent:
+            self._add_columns(chunk, self.solid_blocks(chunk), True)
+        else:
+            steps = self._solid_blocks(chunk)
+            self.generation_queue.append((self._generation_step,
+                                          (chunk, steps)))
+
+    def _generation_step(self, chunk, steps):
+        """Runs the next step of generating a chunk in the background.
+
+        The steps run one after the other at the front of the queue. After
+        the last one we add a call to _generate_chunk in the queue for each x
+        and z position in the chunk, followed by a call to compress the
+        chunk.
+
+        Args:
+            chunk: The chunk that is generated.
+            steps: The generator returned by _solid_blocks.
+        """
+        solid = next(steps)
+        if solid is None:
+            self.generation_queue.appendleft((self._generation_step,
+                                              (chunk, steps)))
+            return
+        self._add_columns(chunk, solid, False)
+        # Chunks generated in advance are not drawn yet, so they can be
+        # compressed as soon as all their columns are generated.
+        self.generation_queue.append((self.compress_chunk, (chunk,)))
+
+    def _add_columns(self, chunk, solid, urgent):
+        """Adds the solid blocks of a chunk column by column.
+
+        Args:
+            chunk: The chunk that is generated.
+            solid: The array returned by solid_blocks.
+            urgent: Whether we add the blocks immediately or queue a call to
+                _generate_chunk for each column.
+        """
+        # Collisions can use the blocks before all columns are added.
+        if chunk not in self.occupancy:
+            self.occupancy[chunk] = (0, solid.copy())
         dx, dy, dz = chunk
         dx *= self.CHUNK_SIZE
-        dy *= self.CHUNK_SIZE
         dz *= self.CHUNK_SIZE
-        smoothness = float(random.randint(20, 30))
-        max_height = 10
-        base_level = 5
-        for x in xrange(dx, dx+self.CHUNK_SIZE):
-            for z in xrange(dz, dz+self.CHUNK_SIZE):
-                params = (x, z, smoothness, max_height)
+        for i in xrange(self.CHUNK_SIZE):
+            for j in xrange(self.CHUNK_SIZE):
+                column = np.nonzero(solid[i, :, j])[0].tolist()
+                params = (dx + i, dz + j, column)
                 if urgent:
                     self._generate_chunk(*params)
                 else:
                     self.generation_queue.append((self._generate_chunk,
                                                   params))
 
-    def _generate_chunk(self, x, z, smoothness, max_height):
-        """Generates blocks on position x, z.
+    def solid_blocks(self, chunk):
+        """Returns which blocks of a chunk are solid.
+
+        The terrain is described by a density for every block, a block is
+        solid when its density is positive. The density decreases with the
+        distance above the height generated by a 2D noise function, 3D noise
+        is added on top of it so the surface is less regular.
+
+        Caves are carved out below the surface where two other 3D noise
+        functions are both close to zero, which gives long tunnels. Unlike
+        the density this does not depend on the depth.
+
+        Args:
+            chunk: The chunk to generate.
+
+        Returns:
+            A (CHUNK_SIZE, HEIGHT_LIMIT, CHUNK_SIZE) boolean array indexed by
+            the x, y and z position within the chunk.
+        """
+        for solid in self._solid_blocks(chunk):
+            pass
+        return solid
 
-        The function generates a height using a noise function and then adds
-        blocks from (x, 0, z) all the way up to (x, gen_y, z) where gen_y is
-        the maximum between max_height and the height generated by the noise
-        function.
+    def _solid_blocks(self, chunk):
+        """Computes solid_blocks one noise field at a time.
+
+        Yields None after each noise field and the solid blocks at the end,
+        so the work can be spread over several items of a queue.
+        """
+        x, y, z = chunk
+        dx, dz = x*self.CHUNK_SIZE, z*self.CHUNK_SIZE
+        heights = self.terrain_heights(chunk)[:, np.newaxis, :]
+        yield None
+        shape = (self.CHUNK_SIZE, self.HEIGHT_LIMIT, self.CHUNK_SIZE)
+        ys = np.arange(self.HEIGHT_LIMIT).reshape(1, -1, 1)
+        density = ((heights + 0.5 - ys) / self.FALLOFF +
+                   noise_field(self.noise, dx, 0, dz, shape))
+        yield None
+        # Shifting the noise makes the cave noise independent of the
+        # density and of each other.
+        tunnel_a = noise_field(self.noise, dx, 1000, dz, shape)
+        yield None
+        tunnel_b = noise_field(self.noise, dx, 2000, dz, shape)
+        cave = ((abs(tunnel_a) < self.CAVE_WIDTH) &
+                (abs(tunnel_b) < self.CAVE_WIDTH) & (ys <= heights))
+        solid = (density > 0) & ~cave
+        # Keep a floor so you cannot fall into oblivion.
+        solid[:, 0, :] = True
+        yield solid
+
+    def terrain_heights(self, chunk):
+        """Returns the generated terrain height of each column in a chunk.
+
+        Unlike chunk_heightmap this ignores caves and changes made to the
+        world. The heights are cached by seed, terrain parameters and chunk,
+        so asking for them again does not evaluate the noise again.
+
+        Args:
+            chunk: The chunk to get the heights for.
+
+        Returns:
+            A read-only (CHUNK_SIZE, CHUNK_SIZE) array indexed by the x and z
+            position within the chunk.
+        """
+        x, y, z = chunk
+        # The parameters are part of the key because the cache is shared by
+        # all worlds and they can be changed per world.
+        key = (self.seed, self.CHUNK_SIZE, self.SMOOTHNESS, self.BASE_HEIGHT,
+               self.MAX_HEIGHT, chunk)
+        return self.heightmap_cache.get(
+            key,
+            lambda: surface_heights(self.noise, x*self.CHUNK_SIZE,
+                                    z*self.CHUNK_SIZE, self.CHUNK_SIZE,
+                                    self.SMOOTHNESS, self.BASE_HEIGHT,
+                                    self.MAX_HEIGHT))
+
+    def _generate_chunk(self, x, z, column):
+        """Generates blocks on position x, z.
 
         Args:
             x: The x position of the blocks.
             z: The z position of the blocks.
-            smoothness: How smooth the terrain is.
-            max_height: The maximum y position of a block.
+            column: The y positions of the solid blocks in the column.
         """
-        height = max_height*clamp(0, fbm(x/smoothness, z/smoothness, 0), 1)
-        for y in xrange(int(height)+1):
-            self.add_block((x, y, z), GrassBlock(), False)
+        solid = set(column)
+        for y in column:
+            if y + 1 in solid:
+                self.add_block((x, y, z), DirtBlock(), False)
+            else:
+                self.add_block((x, y, z), GrassBlock(), False)
 
     def chunk_position(self, position):
         """Returns the chunk associated with the given position.